@@ -22,11 +22,13 @@ Modules included:
 from .scheduler import (
     safe_run_target,
     safe_run_iteration,
+    create_executor,
     update_missing_iterations_concurrent,
 )
 from .sizes import (
     generate_sizes,
     get_num_workers,
+    get_workers_for_size,
 )
 from .processor import (
     update_overall_results,
@@ -42,6 +44,11 @@ from .config import (
     SLOW_MODE,
     DEFAULT_ITERATIONS,
     DEFAULT_THRESHOLD,
+    MAX_SIZE,
+    MAX_WORKERS,
+    IN_PROCESS_MAX_SIZE,
+    IN_PROCESS_MAX_SECONDS,
+    GC_THRESHOLD,
 )
 from .csv_utils import (
     read_csv_results,
@@ -50,6 +57,7 @@ from .csv_utils import (
     get_csv_results_for_size,
 )
 from .markdown_utils import (
+    write_details,
     write_markdown,
     write_algorithm_markdown,
     rebuild_readme,
@@ -61,8 +69,10 @@ from .utils import (
     format_time,
     group_rankings,
     run_iteration,
+    run_iteration_batch,
     compute_average,
     compute_median,
+    compute_stats,
     compute_variance,
     ordinal,
     format_size,
@@ -72,10 +82,12 @@ __all__ = [
     # scheduler functions
     "safe_run_target",
     "safe_run_iteration",
+    "create_executor",
     "update_missing_iterations_concurrent",
     # sizes functions
     "generate_sizes",
     "get_num_workers",
+    "get_workers_for_size",
     # processor functions
     "update_overall_results",
     "process_size",
@@ -88,12 +100,18 @@ __all__ = [
     "SLOW_MODE",
     "DEFAULT_ITERATIONS",
     "DEFAULT_THRESHOLD",
+    "MAX_SIZE",
+    "MAX_WORKERS",
+    "IN_PROCESS_MAX_SIZE",
+    "IN_PROCESS_MAX_SECONDS",
+    "GC_THRESHOLD",
     # csv_utils functions
     "read_csv_results",
     "ensure_csv_ends_with_newline",
     "sort_csv_alphabetically",
     "get_csv_results_for_size",
     # markdown_utils functions
+    "write_details",
     "write_markdown",
     "write_algorithm_markdown",
     "rebuild_readme",
@@ -103,8 +121,10 @@ __all__ = [
     "format_time",
     "group_rankings",
     "run_iteration",
+    "run_iteration_batch",
     "compute_average",
     "compute_median",
+    "compute_stats",
     "compute_variance",
     "ordinal",
     "format_size",
@@ -5,7 +5,7 @@ Global configuration for the Sorting Algorithms Benchmark application.
 
 This module defines:
   - Global flags (e.g. VERBOSE, SLOW_MODE).
-  - Default benchmark parameters.
+  - Default benchmark and scheduling parameters.
   - A debug function for printing verbose messages.
 """
 
@@ -17,6 +17,13 @@ FAST_MODE = False  # Set to True to use all available cores minus 2.
 # Default benchmark parameters.
 DEFAULT_ITERATIONS = 500
 DEFAULT_THRESHOLD = 300
+MAX_SIZE = 100_000_000  # Largest array size; bigger arrays do not fit in memory.
+
+# Scheduling parameters.
+MAX_WORKERS = None  # Cap on worker processes; None leaves it to get_num_workers().
+IN_PROCESS_MAX_SIZE = 1000  # Untimed sizes up to this run in the main process.
+IN_PROCESS_MAX_SECONDS = 0.01  # Algorithms slower than this per iteration use the pool.
+GC_THRESHOLD = (100_000, 20, 20)  # Fewer cyclic GC passes interrupting timed sorts.
 
 
 def debug(msg):
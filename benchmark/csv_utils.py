@@ -13,73 +13,94 @@ This module provides functions to:
 import csv
 import os
 from collections import OrderedDict
-from .utils import compute_median, compute_average
+from operator import itemgetter, le
+from .utils import compute_stats
 
 
-def read_csv_results(csv_path, expected_algs, max_iterations=None):
+def _parse_csv(csv_path, expected_algs, max_iterations=None):
     """
-    Parse benchmark results from a CSV file and compute performance statistics.
-
-    The CSV file is expected to have a header row followed by rows with:
-      [Algorithm, Array Size, Iteration, Elapsed Time (seconds)]
-
-    Only valid (float-convertible) elapsed times are used for calculations.
+    Parse a results CSV into per-algorithm mappings of iteration number to elapsed time.
 
     Parameters:
       csv_path (str): Path to the CSV file.
       expected_algs (list): List of algorithm names expected in the CSV.
+      max_iterations (int): If given, rows for later iterations are ignored.
 
     Returns:
-      OrderedDict: Mapping from algorithm to a tuple of statistics:
-                   (avg, min, max, median, count, times_list)
-                   If no valid data exists for an algorithm, its value is None.
+      OrderedDict: Mapping from algorithm to {iteration: time}, where the time is None
+                   for rows without a valid time (e.g. "DNF").
     """
-    algorithm_times = OrderedDict((alg, []) for alg in expected_algs)
+    algorithm_times = OrderedDict((alg, {}) for alg in expected_algs)
 
     with open(csv_path, "r", newline="") as csvfile:
         reader = csv.reader(csvfile)
-        try:
-            next(reader)  # Skip header row.
-        except StopIteration:
-            return algorithm_times  # Empty file; return defaults.
+        if next(reader, None) is None:
+            return algorithm_times  # Empty file; no algorithm has results yet.
 
         for row in reader:
-            if not row or len(row) < 4:
+            if len(row) < 4:
                 continue  # Skip empty or malformed rows.
-            alg = row[0]
+            # Group by algorithm first so rows for unexpected algorithms are never parsed.
+            by_iter = algorithm_times.get(row[0])
+            if by_iter is None:
+                continue
             try:
                 iter_num = int(row[2])
-            except Exception:
+            except ValueError:
                 continue  # Skip rows with invalid iteration numbers.
+            # If max_iterations is specified, only add rows with iteration <= max_iterations.
+            if max_iterations is not None and iter_num > max_iterations:
+                continue
+            if iter_num in by_iter:
+                continue  # Keep the first result recorded for an iteration.
             try:
-                t = float(row[3])
-            except Exception:
-                continue  # Skip rows with invalid time values.
-            if alg in algorithm_times:
-                # If max_iterations is specified, only add rows with iteration <= max_iterations.
-                if max_iterations is not None and iter_num > max_iterations:
-                    continue
-                algorithm_times[alg].append((iter_num, t))
+                by_iter[iter_num] = float(row[3])
+            except ValueError:
+                by_iter[iter_num] = None  # Recorded, but without a time (e.g. "DNF").
 
-    results = OrderedDict()
-    for alg in expected_algs:
-        entries = algorithm_times[alg]
-        # Sort the entries by iteration number.
-        entries.sort(key=lambda x: x[0])
-        # If max_iterations is specified, take only the first max_iterations entries.
-        if max_iterations is not None:
-            entries = entries[:max_iterations]
-        times = [t for (_, t) in entries]
-        if times:
-            avg = compute_average(times)
-            median = compute_median(times)
-            results[alg] = (avg, min(times), max(times), median, len(times), times)
-        else:
-            results[alg] = None
+    return algorithm_times
+
+
+def _summarize(algorithm_times):
+    """
+    Compute performance statistics from parsed CSV times.
+
+    Parameters:
+      algorithm_times (OrderedDict): Output of _parse_csv().
 
+    Returns:
+      OrderedDict: Mapping from algorithm to (avg, min, max, median, count, times_list),
+                   or None if the algorithm has no valid times.
+    """
+    results = OrderedDict()
+    for alg, by_iter in algorithm_times.items():
+        # Order the times by iteration number, leaving out rows without a time.
+        times = [by_iter[i] for i in sorted(by_iter) if by_iter[i] is not None]
+        results[alg] = (*compute_stats(times), len(times), times) if times else None
     return results
 
 
+def read_csv_results(csv_path, expected_algs, max_iterations=None):
+    """
+    Parse benchmark results from a CSV file and compute performance statistics.
+
+    The CSV file is expected to have a header row followed by rows with:
+      [Algorithm, Array Size, Iteration, Elapsed Time (seconds)]
+
+    Only valid (float-convertible) elapsed times are used for calculations.
+
+    Parameters:
+      csv_path (str): Path to the CSV file.
+      expected_algs (list): List of algorithm names expected in the CSV.
+
+    Returns:
+      OrderedDict: Mapping from algorithm to a tuple of statistics:
+                   (avg, min, max, median, count, times_list)
+                   If no valid data exists for an algorithm, its value is None.
+    """
+    return _summarize(_parse_csv(csv_path, expected_algs, max_iterations))
+
+
 def ensure_csv_ends_with_newline(csv_path):
     """
     Ensure that the CSV file ends with a newline character.
@@ -106,6 +127,9 @@ def sort_csv_alphabetically(csv_path):
     """
     Sort the CSV rows (except the header) alphabetically by algorithm name and iteration number.
 
+    The file is only rewritten if its rows are out of order, so sizes where no new
+    results were appended cost a single read.
+
     Parameters:
       csv_path (str): Path to the CSV file.
     """
@@ -116,7 +140,10 @@ def sort_csv_alphabetically(csv_path):
         return  # Nothing to sort.
     header = rows[0]
     data_rows = [row for row in rows[1:] if row and len(row) > 0]
-    data_rows.sort(key=lambda row: (row[0], int(row[2])))
+    keys = [(row[0], int(row[2])) for row in data_rows]
+    if len(data_rows) == len(rows) - 1 and all(map(le, keys, keys[1:])):
+        return  # Already sorted; leave the file untouched.
+    data_rows = [row for _, row in sorted(zip(keys, data_rows), key=itemgetter(0))]
     with open(csv_path, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(header)
@@ -137,18 +164,21 @@ def get_csv_results_for_size(
       output_folder (str): Folder where CSV files are stored.
 
     Returns:
-      tuple: (csv_path, size_results, max_iters)
+      tuple: (csv_path, size_results, recorded)
              - csv_path (str): Full path to the CSV file.
              - size_results (OrderedDict): Parsed benchmark results.
-             - max_iters (dict): Mapping from algorithm to the maximum iteration number (currently 0 for all).
+             - recorded (dict): Mapping from algorithm to the set of iteration numbers
+               already in the file, including rows without a time (e.g. "DNF").
     """
     csv_filename = f"results_{size}.csv"
     csv_path = os.path.join(output_folder, csv_filename)
     if os.path.exists(csv_path):
-        size_results = read_csv_results(csv_path, expected_algs, max_iterations)
-        max_iters = {
-            alg: 0 for alg in expected_algs
-        }  # Placeholder for iteration count.
+        # Only files left over from an earlier run can end mid-row; the ones written
+        # here always end with a newline.
+        ensure_csv_ends_with_newline(csv_path)
+        algorithm_times = _parse_csv(csv_path, expected_algs, max_iterations)
+        size_results = _summarize(algorithm_times)
+        recorded = {alg: set(by_iter) for alg, by_iter in algorithm_times.items()}
     else:
         # Create new CSV file with header.
         with open(csv_path, "w", newline="") as csv_file:
@@ -157,6 +187,5 @@ def get_csv_results_for_size(
                 ["Algorithm", "Array Size", "Iteration", "Elapsed Time (seconds)"]
             )
         size_results = OrderedDict((alg, None) for alg in expected_algs)
-        max_iters = {alg: 0 for alg in expected_algs}
-    ensure_csv_ends_with_newline(csv_path)
-    return csv_path, size_results, max_iters
+        recorded = {alg: set() for alg in expected_algs}
+    return csv_path, size_results, recorded
@@ -6,22 +6,25 @@ Generates markdown reports based on benchmark results.
 Handles:
   - Writing detailed markdown sections for each array size.
   - Generating individual algorithm markdown report files.
-  - Updating the Table of Contents (TOC) in the details markdown file.
+  - Building the Table of Contents (TOC) of the details markdown file.
   - Rebuilding the main README.md file with overall results, skipped algorithms, and detailed sections.
 
 Functions:
-  - write_markdown(md_file, size, size_results, skip_list):
+  - write_details(details_path, sections, sizes):
+        Writes details.md with its header, a Table of Contents, and the per-size sections.
+  - write_markdown(md_file, size, size_results, skip_list, removed_here=None):
         Writes a markdown section summarizing benchmark results for a specific array size.
   - write_algorithm_markdown(per_alg_results):
         Creates individual markdown files for each algorithm with their benchmark results.
-  - update_details_with_toc(details_path):
-        Updates the TOC in details.md based on current array size sections and ensures the report description is above it.
-  - rebuild_readme(overall_totals, details_path, skip_list):
+  - rebuild_readme(overall_totals, details_path, skip_list, details_content=None):
         Rebuilds the main README.md file using aggregated results and detailed markdown data.
 """
 
 import os
 import re
+import shutil
+import string
+from operator import itemgetter
 from .utils import format_size, format_time, group_rankings, ordinal, compute_variance
 from .config import debug
 
@@ -35,8 +38,169 @@ REPORT_DESCRIPTION = (
     "the algorithm's performance is less predictable. Algorithms that do not meet performance criteria at certain sizes are noted accordingly.\n\n"
 )
 
+# DETAILS_COLUMNS explains the columns of the per-size tables in details.md.
+DETAILS_COLUMNS = (
+    "Below is a table of benchmark results for each array size. "
+    "The columns are defined as follows:\n\n"
+    "- **Rank:** Ranking order based on average runtime.\n"
+    "- **Algorithm(s):** Name(s) of the algorithm(s). Ties indicate similar performance.\n"
+    "- **Average Time:** Average runtime over all iterations.\n"
+    "- **Median Time:** Median runtime for the algorithm.\n"
+    "- **Variance (%):** Percentage difference between maximum and minimum runtimes relative to the average. "
+    "For a single algorithm (no tie), a lower variance (typically below 10%) indicates consistent performance, "
+    "while a higher variance (often above 50%) indicates variability. "
+    "This column is left blank for ties.\n\n"
+)
+
+# ALGORITHM_INTRO follows the title of every per-algorithm file, up to its table rows.
+ALGORITHM_INTRO = (
+    REPORT_DESCRIPTION
+    + "The table below shows benchmark results for various array sizes.\n\n"
+    "- **Array Size:** The number of elements sorted.\n"
+    "- **Average Time:** The average runtime for the algorithm at that array size.\n"
+    "- **Median Time:** The median runtime for the algorithm.\n"
+    "- **Min Time:** The fastest recorded runtime.\n"
+    "- **Max Time:** The slowest recorded runtime.\n"
+    "- **Variance (%):** The percentage difference between the max and min runtimes relative to the average. "
+    "For a single measurement, lower variance (typically below 10%) means consistent performance, while higher "
+    "variance (often above 50%) indicates variability. This column is left blank if there are ties.\n\n"
+    "| Array Size | Average Time | Median Time | Min Time | Max Time | Variance (%) |\n"
+    "| ---------- | ------------ | ----------- | -------- | -------- | ------------ |\n"
+)
+
+# Maps an array size label to its heading anchor: drop commas, hyphenate spaces, lowercase.
+_ANCHOR_TRANS = str.maketrans(
+    {",": None, " ": "-", **{c: c.lower() for c in string.ascii_uppercase}}
+)
+# details.md headings that rebuild_readme() lowers by one level.
+_DETAILS_HEADING_RE = re.compile(
+    r"^(# Detailed Benchmark Results|## Table of Contents|## Array Size:)",
+    re.MULTILINE,
+)
+
+
+def _build_toc(size_labels):
+    """
+    Build the details.md Table of Contents for the given array size headers.
+
+    Parameters:
+      size_labels (list): Formatted array sizes, as they appear in the "## Array Size:" headers.
+
+    Returns:
+      str: The TOC markdown, ending with a newline.
+    """
+    toc_lines = ["## Table of Contents", ""]
+    for s in size_labels:
+        anchor = f"array-size-{s.strip().translate(_ANCHOR_TRANS)}"
+        toc_lines.append(f"- [Array Size: {s}](#{anchor})")
+    toc_lines.append("")  # Ensure a single trailing blank line
+    return "\n".join(toc_lines)
+
+
+def _has_content(path, text):
+    """
+    Check whether the file at path already holds exactly the given text.
+
+    Parameters:
+      path (str): The file path to check.
+      text (str): The expected content.
+
+    Returns:
+      bool: True if the file exists and its content equals text.
+    """
+    try:
+        with open(path, "r") as f:
+            return f.read() == text
+    except FileNotFoundError:
+        return False
+
+
+def _write_atomic(path, text):
+    """
+    Replace the file at path with the given text in one step, unless it is unchanged.
+
+    The text is written to a ".tmp" file next to the target, which is then renamed over
+    it, so a crash or reader never sees a partially written report. The temporary file
+    is removed again if writing fails or is interrupted. A symlinked report is written
+    through, and an existing report keeps its permissions. A 1 MiB buffer lets the
+    content reach the temporary file in a single write. A file that already holds the
+    same text is left untouched, so its modification time only changes when the report
+    does.
+
+    Parameters:
+      path (str): The file path to write.
+      text (str): The content to write.
 
-def write_markdown(md_file, size, size_results, skip_list):
+    Returns:
+      bool: True if the file was written, False if it was already up to date.
+    """
+    if _has_content(path, text):
+        return False
+    # Write through a symlinked report rather than replacing the link itself.
+    target = os.path.realpath(path)
+    tmp_path = target + ".tmp"
+    try:
+        with open(tmp_path, "w", buffering=1 << 20) as f:
+            f.write(text)
+        if os.path.exists(target):
+            # Keep the permissions the report already had.
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+def _format_variance(avg, mn, mx):
+    """
+    Format the variance percentage of a result for a markdown table.
+
+    Parameters:
+      avg (float): The average runtime.
+      mn (float): The minimum runtime.
+      mx (float): The maximum runtime.
+
+    Returns:
+      str: The variance rounded to a whole percentage, or "N/A" if it is undefined.
+    """
+    variance = compute_variance(avg, mn, mx)
+    return f"{variance:.0f}%" if variance is not None else "N/A"
+
+
+def write_details(details_path, sections, sizes):
+    """
+    Write details.md from the per-size sections produced by write_markdown().
+
+    The file gets the main header, report description, Table of Contents, and column
+    explanations, followed by the sections. The TOC is built from the list of sizes
+    rather than by scanning the written file, so details.md is written once and never
+    read back.
+
+    Parameters:
+      details_path (str): The file path to details.md.
+      sections (str): Markdown for every array size, in order.
+      sizes (list): The array sizes that have a section, in the same order.
+
+    Returns:
+      str: The content written to details.md, for rebuild_readme() to reuse.
+    """
+    content = "".join(
+        [
+            "# Detailed Benchmark Results\n\n",
+            REPORT_DESCRIPTION,
+            _build_toc([format_size(size) for size in sizes]) + "\n",
+            DETAILS_COLUMNS,
+            sections,
+        ]
+    )
+    _write_atomic(details_path, content)
+    debug("Wrote details.md with Table of Contents.")
+    return content
+
+
+def write_markdown(md_file, size, size_results, skip_list, removed_here=None):
     """
     Write a markdown section summarizing benchmark results for a specific array size.
 
@@ -45,102 +209,121 @@ def write_markdown(md_file, size, size_results, skip_list):
     If an algorithm is removed at a given array size due to performance issues,
     a note is appended.
 
+    Only the section is written. Unlike earlier versions, this never adds the
+    details.md header, report description, or column explanations, even when md_file
+    is empty; write_details() adds those and the Table of Contents around the
+    collected sections, and must be given the same sizes in order.
+
     Parameters:
-      md_file (file object): Open file for writing markdown content.
+      md_file (file object): Open file (or text buffer) for writing markdown content.
       size (int): The array size used in the benchmark.
       size_results (dict): Mapping from algorithm name to a tuple containing
                            performance data in the form (avg, min, max, median, count, times_list).
       skip_list (dict): Mapping of algorithms to the array size at which they were removed.
                         An algorithm removed at this size is still included in the ranking.
+      removed_here (list): Algorithms removed at this size, if the caller already knows
+                           them; otherwise they are found by scanning skip_list.
     """
-    debug(f"Writing markdown for array size {format_size(size)}")
-    # If this is the first write to details.md, output the header, report description, and column explanations.
-    if md_file.tell() == 0 and os.path.basename(md_file.name) == "details.md":
-        md_file.write("# Detailed Benchmark Results\n\n")
-        md_file.write(REPORT_DESCRIPTION)
-        md_file.write(
-            "Below is a table of benchmark results for each array size. "
-            "The columns are defined as follows:\n\n"
-        )
-        md_file.write("- **Rank:** Ranking order based on average runtime.\n")
-        md_file.write(
-            "- **Algorithm(s):** Name(s) of the algorithm(s). Ties indicate similar performance.\n"
-        )
-        md_file.write("- **Average Time:** Average runtime over all iterations.\n")
-        md_file.write("- **Median Time:** Median runtime for the algorithm.\n")
-        md_file.write(
-            "- **Variance (%):** Percentage difference between maximum and minimum runtimes relative to the average. "
-            "For a single algorithm (no tie), a lower variance (typically below 10%) indicates consistent performance, "
-            "while a higher variance (often above 50%) indicates variability. "
-            "This column is left blank for ties.\n\n"
-        )
+    size_label = format_size(size)
+    debug(f"Writing markdown for array size {size_label}")
+    # The section is built as a list of strings and written as one string.
+    out = []
     # Write the array size header as a level-2 header.
-    md_file.write(f"## Array Size: {format_size(size)}\n\n")
+    out.append(f"## Array Size: {size_label}\n\n")
 
-    # Build the ranking list.
+    # Build the ranking list. An algorithm not in skip_list defaults to this size, so a
+    # single lookup keeps both active algorithms and those removed at this size.
     ranking = [
-        (alg, data[0], data[1], data[2], data[3])
+        (alg, *data[:4])
         for alg, data in size_results.items()
-        if data is not None and (alg not in skip_list or skip_list[alg] == size)
+        if data is not None and skip_list.get(alg, size) == size
     ]
-    debug(f"Ranking data for size {format_size(size)}: {ranking}")
+    debug(f"Ranking data for size {size_label}: {ranking}")
 
     if ranking:
-        if all(t < 1e-3 for _, t, _, _, _ in ranking):
-            md_file.write(
+        if all(entry[1] < 1e-3 for entry in ranking):
+            out.append(
                 "All algorithms ran in less than 1ms on this array size; differences are negligible.\n\n"
             )
         else:
-            ranking.sort(key=lambda x: x[1])
+            ranking.sort(key=itemgetter(1))
             groups = group_rankings(ranking, margin=1e-3)
             current_rank = 1
-            md_file.write(
+            out.append(
                 "| Rank | Algorithm(s) | Average Time | Median Time | Variance (%) |\n"
             )
-            md_file.write(
+            out.append(
                 "| ---- | ------------ | ------------ | ----------- | ------------ |\n"
             )
             for group in groups:
                 rank_str = ordinal(current_rank)
-                algs = ", ".join(alg for alg, _, _, _, _ in group)
-                avg_time = group[0][1]
-                min_time = group[0][2]
-                max_time = group[0][3]
-                median_time = group[0][4]
+                algs = ", ".join(entry[0] for entry in group)
+                _, avg_time, min_time, max_time, median_time = group[0]
                 if len(group) == 1:
-                    variance = compute_variance(avg_time, min_time, max_time)
-                    variance_str = f"{variance:.0f}%" if variance is not None else "N/A"
+                    variance_str = _format_variance(avg_time, min_time, max_time)
                 else:
                     variance_str = ""
-                md_file.write(
+                out.append(
                     f"| {rank_str} | {algs} | {format_time(avg_time, False)} | {format_time(median_time, False)} | {variance_str} |\n"
                 )
                 current_rank += len(group)
-            md_file.write("\n")
+            out.append("\n")
     else:
-        md_file.write("No algorithms produced a result for this array size.\n\n")
+        out.append("No algorithms produced a result for this array size.\n\n")
 
     # Append a note if any algorithms were skipped at this size.
-    removed_here = [
-        alg for alg, removal_size in skip_list.items() if removal_size == size
-    ]
+    if removed_here is None:
+        removed_here = [
+            alg for alg, removal_size in skip_list.items() if removal_size == size
+        ]
     if removed_here:
-        note = (
+        removed = ", ".join(
+            f"{alg} (at size {format_size(skip_list[alg])})"
+            for alg in sorted(removed_here)
+        )
+        out.append(
             f"**Note:** The following algorithm{'s' if len(removed_here) != 1 else ''} "
-            "were removed for this array size due to performance issues: "
-            + ", ".join(
-                f"{alg} (at size {format_size(skip_list[alg])})"
-                for alg in sorted(removed_here)
-            )
-            + "\n\n"
+            f"were removed for this array size due to performance issues: {removed}\n\n"
         )
-        md_file.write(note)
-        debug(f"Skipped algorithms at size {format_size(size)}: {removed_here}")
-    md_file.flush()
+        debug(f"Skipped algorithms at size {size_label}: {removed_here}")
+    md_file.write("".join(out))
 
-    # Immediately update the TOC (and ensure the description appears above it) after finishing this array size section.
-    if os.path.basename(md_file.name) == "details.md":
-        update_details_with_toc(md_file.name)
+
+def _write_algorithm_file(alg, results, alg_folder):
+    """
+    Write the markdown report for one algorithm, unless it is already up to date.
+
+    The report is built in full and compared with the existing file, so a file whose
+    results have changed is rewritten while an identical one is left untouched.
+
+    Parameters:
+      alg (str): The algorithm name.
+      results (list): The algorithm's [(array size, avg, min, max, median), ...] rows.
+      alg_folder (str): The folder the report is written to.
+
+    Returns:
+      str: A message describing what was done, for the caller to print.
+    """
+    filename = f"{alg.replace(' ', '_')}.md"
+    filepath = os.path.join(alg_folder, filename)
+    # Build the whole file first so it can be compared and written with one call.
+    out = []
+    out.append(f"# {alg} Benchmark Results\n\n")
+    out.append(ALGORITHM_INTRO)
+    out.extend(
+        [
+            f"| {format_size(size)} | {format_time(avg, False)} | {format_time(median, False)} | "
+            f"{format_time(mn, False)} | {format_time(mx, False)} | {_format_variance(avg, mn, mx)} |\n"
+            for size, avg, mn, mx, median in results
+        ]
+    )
+    out.append("\n")
+    content = "".join(out)
+    if _has_content(filepath, content):
+        return f"Markdown file for {alg} is up to date; skipping."
+    with open(filepath, "w") as f:
+        f.write(content)
+    return f"Wrote results for {alg} to {filepath}"
 
 
 def write_algorithm_markdown(per_alg_results):
@@ -149,143 +332,21 @@ def write_algorithm_markdown(per_alg_results):
 
     For each algorithm, creates a file in the "results/algorithms" directory with a table of results
     across different array sizes. An extra column for "Variance (%)" is added for single algorithm rows.
+    Existing files are rewritten only if their content would change.
 
     Parameters:
       per_alg_results (dict): Mapping from algorithm name to a list of tuples in the form:
-                              [(array size, avg, min, max, median), ...].
+                              [(array size, avg, min, max, median), ...],
+                              in ascending order of array size.
     """
     alg_folder = os.path.join("results", "algorithms")
     os.makedirs(alg_folder, exist_ok=True)
     debug(f"Writing individual algorithm markdown files in folder: {alg_folder}")
     for alg, results in per_alg_results.items():
-        filename = f"{alg.replace(' ', '_')}.md"
-        filepath = os.path.join(alg_folder, filename)
-        if not os.path.exists(filepath):
-            with open(filepath, "w") as f:
-                f.write(f"# {alg} Benchmark Results\n\n")
-                f.write(REPORT_DESCRIPTION)
-                f.write(
-                    "The table below shows benchmark results for various array sizes.\n\n"
-                )
-                f.write("- **Array Size:** The number of elements sorted.\n")
-                f.write(
-                    "- **Average Time:** The average runtime for the algorithm at that array size.\n"
-                )
-                f.write("- **Median Time:** The median runtime for the algorithm.\n")
-                f.write("- **Min Time:** The fastest recorded runtime.\n")
-                f.write("- **Max Time:** The slowest recorded runtime.\n")
-                f.write(
-                    "- **Variance (%):** The percentage difference between the max and min runtimes relative to the average. "
-                    "For a single measurement, lower variance (typically below 10%) means consistent performance, while higher "
-                    "variance (often above 50%) indicates variability. This column is left blank if there are ties.\n\n"
-                )
-                f.write(
-                    "| Array Size | Average Time | Median Time | Min Time | Max Time | Variance (%) |\n"
-                )
-                f.write(
-                    "| ---------- | ------------ | ----------- | -------- | -------- | ------------ |\n"
-                )
-                for size, avg, mn, mx, median in sorted(results, key=lambda x: x[0]):
-                    variance = compute_variance(avg, mn, mx)
-                    variance_str = (
-                        f"{variance:.0f}%"
-                        if (variance is not None and avg != 0)
-                        else "N/A"
-                    )
-                    f.write(
-                        f"| {format_size(size)} | {format_time(avg, False)} | {format_time(median, False)} | "
-                        f"{format_time(mn, False)} | {format_time(mx, False)} | {variance_str} |\n"
-                    )
-                f.write("\n")
-            print(f"Wrote results for {alg} to {filepath}")
-        else:
-            print(f"Markdown file for {alg} already exists; skipping.")
-
-
-def update_details_with_toc(details_path):
-    """
-    Update the Table of Contents (TOC) in details.md and ensure the report description appears above it.
-
-    This function performs the following steps:
-      1. Removes any existing TOC (from the "## Table of Contents" header up to the first "## Array Size:" header).
-      2. Splits the content immediately after the "# Detailed Benchmark Results" header.
-      3. Forces REPORT_DESCRIPTION to appear immediately after that header.
-      4. Rebuilds the TOC from all "## Array Size:" headers found in the remainder of the content.
-      5. Inserts the new TOC immediately after REPORT_DESCRIPTION, ensuring one blank line above and below the TOC.
-
-    In details.md, the TOC header is set at level 2.
-
-    Parameters:
-      details_path (str): The file path to details.md.
-    """
-    with open(details_path, "r") as f:
-        content = f.read()
-
-    # Remove any existing TOC section.
-    content = re.sub(
-        r"(?s)## Table of Contents.*?(?=^## Array Size:|\Z)",
-        "",
-        content,
-        flags=re.MULTILINE,
-    )
-
-    # Find the main header.
-    header_pattern = r"^# Detailed Benchmark Results\s*$"
-    header_match = re.search(header_pattern, content, re.MULTILINE)
-    if not header_match:
-        debug("Main header not found in details.md; skipping TOC update.")
-        return
-
-    # Split content after the header.
-    header_end = header_match.end()
-    after_header = content[header_end:].lstrip()
-
-    # Ensure REPORT_DESCRIPTION appears immediately after the header.
-    if not after_header.startswith(REPORT_DESCRIPTION.strip()):
-        # Remove any existing description up to the TOC marker.
-        toc_marker_match = re.search(
-            r"^## Table of Contents", after_header, re.MULTILINE
-        )
-        if toc_marker_match:
-            rest = after_header[toc_marker_match.start() :]
-        else:
-            rest = after_header
-        content = (
-            content[:header_end].rstrip() + "\n\n" + REPORT_DESCRIPTION + "\n" + rest
-        )
-
-    # Build the new TOC by scanning for all "## Array Size:" headers.
-    sizes = re.findall(r"^## Array Size:\s*(.+)$", content, re.MULTILINE)
-    toc_lines = ["## Table of Contents", ""]
-    for s in sizes:
-        anchor = "array-size-" + s.replace(",", "").strip().lower().replace(" ", "-")
-        toc_lines.append(f"- [Array Size: {s}](#{anchor})")
-    toc_lines.append("")  # Ensure a single trailing blank line
-    toc = "\n".join(toc_lines)
-
-    # Insert the new TOC immediately after REPORT_DESCRIPTION.
-    desc_index = content.find(REPORT_DESCRIPTION.strip())
-    if desc_index != -1:
-        desc_end = desc_index + len(REPORT_DESCRIPTION.strip())
-        before = content[:desc_end].rstrip()
-        after = content[desc_end:].lstrip()
-        new_content = before + "\n\n" + toc + "\n" + after
-    else:
-        # Fallback: insert after header.
-        new_content = (
-            content[:header_end].rstrip()
-            + "\n\n"
-            + toc
-            + "\n"
-            + content[header_end:].lstrip()
-        )
+        print(_write_algorithm_file(alg, results, alg_folder))
 
-    with open(details_path, "w") as f:
-        f.write(new_content)
-    debug("Updated details.md with Table of Contents.")
 
-
-def rebuild_readme(overall_totals, details_path, skip_list):
+def rebuild_readme(overall_totals, details_path, skip_list, details_content=None):
     """
     Rebuild the main README.md file using aggregated benchmark results and detailed per-size data.
 
@@ -300,16 +361,17 @@ def rebuild_readme(overall_totals, details_path, skip_list):
       - The report description (REPORT_DESCRIPTION) appears only once as part of the detailed section.
 
     Parameters:
-      overall_totals (dict): Aggregated benchmark results per algorithm.
+      overall_totals (dict): Mapping from algorithm to its [time sum, count] pair.
       details_path (str): The file path to details.md.
       skip_list (dict): Mapping of algorithms to the array size at which they were skipped.
+      details_content (str): Content of details.md as returned by write_details(), if
+                             already in memory; details.md is only read when this is None.
     """
-    overall = {}
-    for alg, totals in overall_totals.items():
-        if totals["count"] > 0:
-            overall[alg] = totals["sum"] / totals["count"]
+    overall = {
+        alg: total / count for alg, (total, count) in overall_totals.items() if count
+    }
 
-    overall_ranking = sorted(overall.items(), key=lambda x: x[1])
+    overall_ranking = sorted(overall.items(), key=itemgetter(1))
     groups = group_rankings(overall_ranking, margin=1e-6)
 
     lines = []
@@ -321,22 +383,19 @@ def rebuild_readme(overall_totals, details_path, skip_list):
     current_rank = 1
     printed_count = 0
     for group in groups:
-        if printed_count < 20:
-            rank_str = ordinal(current_rank)
-            algs = ", ".join(
-                f"[{alg}](results/algorithms/{alg.replace(' ', '_')}.md)"
-                for alg, _ in group
-                if alg not in skip_list
-            )
-            if algs:
-                avg_time = group[0][1]
-                lines.append(
-                    f"| {rank_str} | {algs} | {format_time(avg_time, True)} |\n"
-                )
-                printed_count += len(group)
-                current_rank += len(group)
-        else:
+        if printed_count >= 20:
             break
+        algs = ", ".join(
+            f"[{alg}](results/algorithms/{alg.replace(' ', '_')}.md)"
+            for alg, _ in group
+            if alg not in skip_list
+        )
+        if algs:
+            lines.append(
+                f"| {ordinal(current_rank)} | {algs} | {format_time(group[0][1], True)} |\n"
+            )
+            printed_count += len(group)
+            current_rank += len(group)
     lines.append("\n")
     if printed_count > 20:
         lines.append(
@@ -345,37 +404,31 @@ def rebuild_readme(overall_totals, details_path, skip_list):
 
     lines.append("## Skipped Algorithms\n\n")
     if skip_list:
+        skipped = sorted(skip_list.items(), key=itemgetter(1))
         lines.append("| Algorithm | Skipped At Size |\n")
         lines.append("| --------- | --------------- |\n")
-        for alg, size in sorted(skip_list.items(), key=lambda item: item[1]):
+        for alg, size in skipped:
             lines.append(f"| {alg} | {size} |\n")
         lines.append("\n")
         print(
             "Skipped Algorithms:",
-            ", ".join(
-                f"{alg} (at size {size})"
-                for alg, size in sorted(skip_list.items(), key=lambda item: item[1])
-            ),
+            ", ".join(f"{alg} (at size {size})" for alg, size in skipped),
         )
     else:
         lines.append("No algorithms were skipped.\n\n")
         print("No algorithms were skipped.")
 
-    # Read the detailed markdown content from details.md and lower its headings by one level for README.
-    with open(details_path, "r") as f:
-        details_content = f.read()
-    details_content = details_content.replace(
-        "# Detailed Benchmark Results", "## Detailed Benchmark Results", 1
-    )
-    details_content = details_content.replace(
-        "## Table of Contents", "### Table of Contents", 1
-    )
-    details_content = details_content.replace("## Array Size:", "### Array Size:")
-    lines.append(details_content)
-
-    with open("README.md", "w") as md_file:
-        md_file.writelines(lines)
-        md_file.flush()
-    debug(
-        "Rebuilt README.md with overall top 20, TOC, skipped algorithms, and detailed sections."
-    )
+    # Use the detailed markdown content (read from details.md if not given) with its
+    # headings lowered by one level for README.
+    if details_content is None:
+        with open(details_path, "r") as f:
+            details_content = f.read()
+    # Every heading is lowered in a single pass over the content.
+    lines.append(_DETAILS_HEADING_RE.sub(r"#\1", details_content))
+
+    if _write_atomic("README.md", "".join(lines)):
+        debug(
+            "Rebuilt README.md with overall top 20, TOC, skipped algorithms, and detailed sections."
+        )
+    else:
+        debug("README.md is already up to date; not rewritten.")
@@ -14,40 +14,49 @@ Functions:
   - run_sorting_tests(): Execute the complete benchmark cycle.
 """
 
+import gc
+import io
 import os
 import sys
 
 from .utils import format_size
 from .csv_utils import get_csv_results_for_size, sort_csv_alphabetically
-from .markdown_utils import rebuild_readme, write_markdown, write_algorithm_markdown
+from .markdown_utils import (
+    rebuild_readme,
+    write_details,
+    write_markdown,
+    write_algorithm_markdown,
+)
 from .sizes import generate_sizes, get_num_workers
-from .scheduler import update_missing_iterations_concurrent
+from .scheduler import create_executor, update_missing_iterations_concurrent
 from .exit_handlers import shutdown_requested
 from .algorithms_map import get_algorithms
+from .config import GC_THRESHOLD
 
 
 def update_overall_results(
-    size, size_results, expected_algs, overall_totals, per_alg_results, iterations
+    size, size_results, expected_algs, overall_totals, per_alg_results
 ):
     """
     Update aggregated benchmark results for a specific array size.
 
-    For each algorithm, the function updates the cumulative time sum and count,
-    and records the per-size performance statistics.
+    For each algorithm, the function adds the raw times of its successful runs to the
+    cumulative time sum and count, and records the per-size performance statistics.
 
     Parameters:
       size (int): Current array size.
       size_results (dict): Mapping from algorithm to performance tuple.
       expected_algs (list): List of expected algorithm names.
-      overall_totals (dict): Accumulated overall results.
+      overall_totals (dict): Mapping from algorithm to its [time sum, count] pair.
       per_alg_results (dict): Per-algorithm results by array size.
-      iterations (int): Number of iterations per algorithm.
     """
     for alg in expected_algs:
         data = size_results[alg]
+        # Algorithms without a successful run (e.g. all timed out) have no results.
         if data is not None:
-            overall_totals[alg]["sum"] += data[0] * iterations
-            overall_totals[alg]["count"] += iterations
+            totals = overall_totals[alg]
+            totals[0] += sum(data[5])
+            totals[1] += len(data[5])
             per_alg_results[alg].append((size, data[0], data[1], data[2], data[3]))
 
 
@@ -60,13 +69,14 @@ def process_size(
     per_alg_results,
     skip_list,
     per_run_timeout=False,
+    executor=None,
 ):
     """
     Process benchmark tests for a single array size.
 
     Retrieves or creates the CSV file for the size, updates missing iterations,
-    sorts the CSV, and updates overall performance metrics. Also marks algorithms
-    exceeding the time threshold for skipping.
+    sorts the CSV, and updates overall performance metrics from the in-memory results.
+    Also marks algorithms exceeding the time threshold for skipping.
 
     Parameters:
       size (int): Current array size.
@@ -77,28 +87,18 @@ def process_size(
       per_alg_results (dict): Per-algorithm performance records.
       skip_list (dict): Algorithms to skip (keyed by algorithm name).
       per_run_timeout (bool): Enable per-iteration timeout if True.
+      executor (Executor): Shared executor used to run iterations, if any.
 
     Returns:
       tuple: (size_results, skip_list)
     """
     # Retrieve CSV file and current results.
-    csv_path, size_results, *_ = get_csv_results_for_size(
+    csv_path, size_results, recorded = get_csv_results_for_size(
         size, expected_algs, max_iterations=iterations
     )
 
-    # Determine the number of worker processes.
-    current_workers = get_num_workers()
-    process_size.workers = getattr(process_size, "workers", None)
-    if process_size.workers is None or current_workers != process_size.workers:
-        if process_size.workers is None:
-            print(
-                f"Using {current_workers} worker{'s' if current_workers > 1 else ''}."
-            )
-        else:
-            print(
-                f"Changing workers from {process_size.workers} to {current_workers} worker{'s' if current_workers > 1 else ''}."
-            )
-        process_size.workers = current_workers
+    # Use the worker count chosen by run_sorting_tests, or determine it for a standalone call.
+    current_workers = getattr(process_size, "workers", None) or get_num_workers()
 
     # Update missing iterations concurrently.
     size_results, skip_list = update_missing_iterations_concurrent(
@@ -111,25 +111,24 @@ def process_size(
         threshold,
         current_workers,
         per_run_timeout,
+        executor,
+        recorded,
     )
     # Sort CSV for consistency.
     sort_csv_alphabetically(csv_path)
-    # Re-read updated CSV and update overall results.
-    _, updated_results, *_ = get_csv_results_for_size(
-        size, expected_algs, max_iterations=iterations
-    )
+    # size_results is already up to date, so the CSV is not read back.
     update_overall_results(
         size,
-        updated_results,
+        size_results,
         expected_algs,
         overall_totals,
         per_alg_results,
-        iterations,
     )
 
-    # Mark algorithms exceeding the threshold for skipping.
-    for alg, data in updated_results.items():
-        if data is not None and data[0] > threshold and alg not in skip_list:
+    # Mark algorithms exceeding the threshold for skipping. Every algorithm not already
+    # skipped was run at this size, so one without results never finished a run.
+    for alg, data in size_results.items():
+        if alg not in skip_list and (data is None or data[0] > threshold):
             skip_list[alg] = size
     return size_results, skip_list
 
@@ -142,7 +141,13 @@ def run_sorting_tests(iterations=500, threshold=300, per_run_timeout=False):
       - Generates array sizes.
       - Processes benchmarks for each size.
       - Updates CSV files and markdown reports.
-      - Rebuilds the overall README.md file.
+      - Rebuilds the overall README.md file once all sizes are done.
+
+    If the run is stopped with Ctrl+C or SIGTERM, details.md and README.md are still
+    written, covering only the sizes finished so far; the per-algorithm files are not.
+    If it fails with any other exception, no report is written and the ones from the
+    previous run are left as they were. The CSV results are kept in every case, so
+    the next run rebuilds every report from them.
 
     Parameters:
       iterations (int): Number of iterations per algorithm for each size.
@@ -152,21 +157,33 @@ def run_sorting_tests(iterations=500, threshold=300, per_run_timeout=False):
 
     sizes = generate_sizes()
     expected_algs = list(get_algorithms().keys())
-    overall_totals = {alg: {"sum": 0, "count": 0} for alg in expected_algs}
+    # [time sum, count] per algorithm, updated in place.
+    overall_totals = {alg: [0.0, 0] for alg in expected_algs}
+    # Rows are appended as sizes are processed, so each list is already in size order.
     per_alg_results = {alg: [] for alg in expected_algs}
     skip_list = {}
+    # Algorithms not yet skipped; only these are benchmarked and scanned at later sizes.
+    active_algs = list(expected_algs)
     output_folder = "results"
     os.makedirs(output_folder, exist_ok=True)
     details_path = "details.md"
-    # Clear previous details.
-    with open(details_path, "w") as f:
-        f.write("")
+    # Per-size sections are collected here and written to details.md once at the end.
+    details_buf = io.StringIO()
+    # Sizes with a section in details_buf, in order; the TOC is built from these.
+    details_sizes = []
     # Get initial worker count.
     process_size.workers = get_num_workers()
     print(
         f"Using {process_size.workers} worker{'s' if process_size.workers > 1 else ''}."
     )
-
+    # With CPython's default thresholds, sorts that build many lists or nodes trigger
+    # frequent cyclic collections in the middle of timed iterations. Set before the pool
+    # is created so forked workers inherit it.
+    gc.set_threshold(*GC_THRESHOLD)
+    # Create one executor for the whole run so workers are not respawned per size.
+    executor = create_executor(process_size.workers, per_run_timeout)
+
+    failed = False
     try:
         for size in sizes:
             if shutdown_requested:
@@ -177,21 +194,19 @@ def run_sorting_tests(iterations=500, threshold=300, per_run_timeout=False):
                 size,
                 iterations,
                 threshold,
-                expected_algs,
+                active_algs,
                 overall_totals,
                 per_alg_results,
                 skip_list,
                 per_run_timeout=per_run_timeout,
+                executor=executor,
             )
-            # Mark slow algorithms for skipping.
-            for alg, data in size_results.items():
-                if data is not None and data[0] > threshold and alg not in skip_list:
-                    skip_list[alg] = size
+            # Every algorithm skipped at this size was still active before it.
+            removed_here = [alg for alg in active_algs if alg in skip_list]
+            active_algs = [alg for alg in active_algs if alg not in skip_list]
             # Append markdown details for this size.
-            with open(details_path, "a") as f:
-                write_markdown(f, size, size_results, skip_list)
-            # Rebuild overall README.
-            rebuild_readme(overall_totals, details_path, skip_list)
+            write_markdown(details_buf, size, size_results, skip_list, removed_here)
+            details_sizes.append(size)
 
             # Re-check the number of worker processes based on current time.
             current_workers = get_num_workers()
@@ -200,9 +215,26 @@ def run_sorting_tests(iterations=500, threshold=300, per_run_timeout=False):
                     f"Updating worker count from {process_size.workers} to {current_workers} worker{'s' if process_size.workers > 1 else ''}."
                 )
                 process_size.workers = current_workers
+                # Rebuild the shared executor with the new worker count.
+                executor.shutdown()
+                executor = create_executor(current_workers, per_run_timeout)
     except KeyboardInterrupt:
         print("KeyboardInterrupt detected. Exiting gracefully.")
         sys.exit(0)
+    except Exception:
+        failed = True
+        raise
+    finally:
+        executor.shutdown()
+        # Write details.md and rebuild the overall README from the sizes finished so
+        # far, also when the run is stopped by Ctrl+C or SIGTERM. A run that fails
+        # leaves the previous reports in place. The README reuses the details content
+        # in memory rather than reading the file back.
+        if details_sizes and not failed:
+            details_content = write_details(
+                details_path, details_buf.getvalue(), details_sizes
+            )
+            rebuild_readme(overall_totals, details_path, skip_list, details_content)
 
     # Generate individual algorithm markdown reports.
     write_algorithm_markdown(per_alg_results)
@@ -5,24 +5,95 @@ Provides functions to safely run sorting iterations and schedule missing iterati
 
 Features:
   - Running individual iterations in separate processes with optional timeouts.
-  - Scheduling missing iterations using concurrent futures.
-  - Writing iteration results immediately to CSV with data persistence.
+  - Pinning each pool worker to a single CPU core to reduce timing noise.
+  - Scheduling missing iterations using concurrent futures, or in-process for small sizes.
+  - Creating a worker pool that can be shared across algorithms and sizes.
+  - Writing iteration results immediately to CSV with data persistence, from a background
+    thread while results are collected from the worker pool.
 
 Functions:
   - safe_run_target(): Runs a single iteration and sends back the result.
   - safe_run_iteration(): Executes a single iteration with a timeout.
+  - create_executor(): Creates the worker pool used to run iterations.
   - update_missing_iterations_concurrent(): Schedules missing iterations concurrently.
 """
 
 import csv
 import sys
 import os
+import threading
+import multiprocessing
+from bisect import bisect_left
+from queue import Queue
 from multiprocessing import Pipe, Process
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from .exit_handlers import shutdown_requested
-from .utils import format_size, run_iteration, compute_average, compute_median, format_time
+from .utils import (
+    format_size,
+    run_iteration,
+    run_iteration_batch,
+    compute_stats,
+    format_time,
+)
 from .algorithms_map import get_algorithms
-from .config import debug
+from .sizes import get_workers_for_size
+from .config import debug, IN_PROCESS_MAX_SIZE, IN_PROCESS_MAX_SECONDS
+
+# On Linux, fork the process pool's workers so they inherit the already-imported
+# algorithm modules instead of re-importing every one of them; other platforms keep their
+# default start method. Only the pool uses this context. safe_run_iteration starts its
+# processes with the plain multiprocessing.Process, as before, so their start method is
+# the platform default; on Linux before Python 3.14 that is still fork.
+_MP_CONTEXT = multiprocessing.get_context(
+    "fork" if sys.platform.startswith("linux") else None
+)
+
+
+def _pin_worker(counter):
+    """
+    Pin the calling worker process to a single CPU core.
+
+    Used as the ProcessPoolExecutor initializer. Each worker takes the next slot from a
+    shared counter, so workers are spread across the cores available to this process
+    instead of migrating between them mid-iteration. Pinning relies on
+    os.sched_setaffinity and is skipped on platforms that do not provide it.
+
+    Parameters:
+      counter (Value): Shared integer used to hand out core slots.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    with counter.get_lock():
+        slot = counter.value
+        counter.value += 1
+    cores = sorted(os.sched_getaffinity(0))
+    try:
+        os.sched_setaffinity(0, {cores[slot % len(cores)]})
+    except OSError as e:
+        debug(f"Could not pin worker to a CPU core: {e}")
+
+
+def _run_named_batch(alg, size, n):
+    """
+    Run a batch of iterations for an algorithm looked up by name.
+
+    Submitted to pool workers in place of the sort function itself, so that only the
+    name is sent to the worker, which resolves it from its own algorithm mapping.
+
+    Parameters:
+      alg (str): Algorithm name.
+      size (int): Array size for the iterations.
+      n (int): Number of iterations to run.
+
+    Returns:
+      list: Elapsed times in seconds, one per iteration.
+    """
+    return run_iteration_batch(get_algorithms()[alg], size, n)
 
 
 def safe_run_target(conn, sort_func, size):
@@ -73,6 +144,247 @@ def safe_run_iteration(sort_func, size, timeout):
     return None
 
 
+def _run_batches_inline(batches, size, executor, num_workers):
+    """
+    Run batches of untimed iterations in the current process.
+
+    An algorithm whose batch averages more than IN_PROCESS_MAX_SECONDS per iteration is
+    too slow to gain anything from running in-process: the times of that batch are
+    discarded, and it is set aside with the algorithm's remaining batches to run on the
+    executor once every other batch is done. Batches of the algorithm that already ran
+    in-process were yielded and are kept. Callers should give each algorithm a
+    single-iteration first batch so this is noticed early, before any of its times are
+    recorded.
+
+    Once a batch of an algorithm raises, its remaining batches are not run.
+
+    Parameters:
+      batches (list): List of (algorithm name, list of iteration numbers) tuples.
+      size (int): Array size for the iterations.
+      executor (Executor): Executor from create_executor() for slow algorithms.
+      num_workers (int): Number of workers to use for slow algorithms.
+
+    Yields:
+      tuple: (algorithm name, iteration numbers, elapsed times). Times are None for
+             iterations that raised an error or were skipped after one.
+    """
+    algorithms = get_algorithms()
+    failed = set()
+    deferred = {}
+    for alg, batch in batches:
+        if alg in failed:
+            yield alg, batch, [None] * len(batch)
+            continue
+        if alg in deferred:
+            deferred[alg].extend(batch)
+            continue
+        try:
+            times = run_iteration_batch(algorithms[alg], size, len(batch))
+            debug(f"Batch complete for {alg} iterations {batch}: result={times}")
+            if sum(times) > IN_PROCESS_MAX_SECONDS * len(times):
+                # Rerun this batch in the pool too rather than recording times
+                # measured in-process for an algorithm that otherwise runs pooled.
+                debug(f"{alg} is slow on size {size}; running it in the pool.")
+                deferred[alg] = list(batch)
+                continue
+        except Exception as e:
+            print(f"{alg} error on size {size} iterations {batch}: {e}")
+            print(f"Skipping the remaining iterations of {alg} on size {size}.")
+            failed.add(alg)
+            times = [None] * len(batch)
+        yield alg, batch, times
+
+    pool_batches = []
+    for alg, remaining in deferred.items():
+        batch_size = max(1, len(remaining) // (num_workers * 4))
+        pool_batches.extend(
+            (alg, remaining[start : start + batch_size])
+            for start in range(0, len(remaining), batch_size)
+        )
+    if pool_batches:
+        yield from _run_batches_pooled(
+            executor, pool_batches, size, None, False, num_workers
+        )
+
+
+def _run_batches_pooled(
+    executor, batches, size, threshold, per_run_timeout, max_in_flight
+):
+    """
+    Run batches on an executor and yield their results as they complete.
+
+    At most max_in_flight tasks are outstanding at once; the next batch is submitted as
+    each one finishes. This caps how many workers of a shared pool a size can occupy.
+
+    When a task of an algorithm raises, that algorithm's tasks which have not started are
+    cancelled and its queued batches are never submitted. Tasks that have not started
+    are also cancelled if the generator is closed early.
+
+    Parameters:
+      executor (Executor): Executor from create_executor().
+      batches (list): List of (algorithm name, list of iteration numbers) tuples.
+      size (int): Array size for the iterations.
+      threshold (float): Per-iteration timeout in seconds when per_run_timeout is True.
+      per_run_timeout (bool): Run each batch as a single timed iteration if True.
+      max_in_flight (int): Maximum number of outstanding tasks.
+
+    Yields:
+      tuple: (algorithm name, iteration numbers, elapsed times). Times are None for
+             iterations that failed or timed out.
+    """
+    algorithms = get_algorithms()
+    queued = iter(batches)
+    pending = {}
+    failed = set()
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                item = next(queued, None)
+                if item is None:
+                    break
+                alg, batch = item
+                if alg in failed:
+                    yield alg, batch, [None] * len(batch)
+                    continue
+                if per_run_timeout:
+                    future = executor.submit(
+                        safe_run_iteration, algorithms[alg], size, threshold
+                    )
+                else:
+                    future = executor.submit(_run_named_batch, alg, size, len(batch))
+                pending[future] = item
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                alg, batch = pending.pop(future)
+                if future.cancelled():
+                    yield alg, batch, [None] * len(batch)
+                    continue
+                try:
+                    result = future.result()
+                    times = result if isinstance(result, list) else [result]
+                    debug(f"Task complete for {alg} iterations {batch}: result={times}")
+                except Exception as e:
+                    print(f"{alg} error on size {size} iterations {batch}: {e}")
+                    times = [None] * len(batch)
+                    if alg not in failed:
+                        print(
+                            f"Skipping the remaining iterations of {alg} on size {size}."
+                        )
+                        failed.add(alg)
+                        # Cancelled futures stay pending and are reported by the next wait().
+                        for other, (other_alg, _) in pending.items():
+                            if other_alg == alg:
+                                other.cancel()
+                yield alg, batch, times
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _format_csv_rows(alg, size, batch, times):
+    """
+    Format a batch of results as CSV text.
+
+    The four fields never need quoting (algorithm names contain no commas or quotes),
+    so lines are built directly rather than through csv.writer. Lines end in CRLF to
+    match the rows csv.writer writes elsewhere in the same file. Times are written to
+    0.1 microsecond, which is below the overhead of the timer calls themselves.
+
+    Parameters:
+      alg (str): Algorithm name.
+      size (int): Array size.
+      batch (list): Iteration numbers.
+      times (list): Elapsed time for each iteration, or None for DNF.
+
+    Returns:
+      str: The formatted rows.
+    """
+    return "".join(
+        (
+            f"{alg},{size},{iter_num},DNF\r\n"
+            if t is None
+            else f"{alg},{size},{iter_num},{t:.7f}\r\n"
+        )
+        for iter_num, t in zip(batch, times)
+    )
+
+
+def _append_csv_rows(csv_file, text):
+    """
+    Write formatted rows to an open CSV file and flush them, reporting (not raising)
+    any write error.
+
+    Parameters:
+      csv_file (file): CSV file opened for appending.
+      text (str): Rows formatted by _format_csv_rows().
+    """
+    try:
+        csv_file.write(text)
+        csv_file.flush()
+        debug("Wrote rows to CSV.")
+    except Exception as e:
+        print(f"Error writing rows to CSV {csv_file.name}: {e}")
+
+
+def _csv_writer_loop(csv_path, row_queue):
+    """
+    Append batches of rows from a queue to a CSV file until a None sentinel arrives.
+
+    Runs on a background thread so that disk writes overlap with collecting results
+    from the worker pool. The file is flushed whenever the queue has been drained, so
+    rows reach the OS promptly without a flush per batch.
+
+    Parameters:
+      csv_path (str): Path to the CSV file.
+      row_queue (Queue): Queue of formatted row text; None stops the writer.
+    """
+    try:
+        with open(csv_path, "a", newline="", buffering=1 << 20) as csv_file:
+            while True:
+                text = row_queue.get()
+                if text is None:
+                    break
+                csv_file.write(text)
+                debug("Wrote rows to CSV.")
+                if row_queue.empty():
+                    csv_file.flush()
+    except Exception as e:
+        print(f"Error writing rows to CSV {csv_path}: {e}")
+
+
+def create_executor(num_workers, per_run_timeout=False):
+    """
+    Create the executor used to run benchmark iterations.
+
+    With per-run timeouts, each iteration already runs in its own killable process, so a
+    thread pool is used to supervise them. Otherwise a process pool is used whose workers
+    are pinned to individual CPU cores and forked on Linux.
+
+    The executor is meant to be created once and reused across algorithms and sizes;
+    the caller is responsible for shutting it down.
+
+    Parameters:
+      num_workers (int): Number of workers in the pool.
+      per_run_timeout (bool): Create a pool suitable for timed iterations if True.
+
+    Returns:
+      Executor: A ThreadPoolExecutor or ProcessPoolExecutor.
+    """
+    if per_run_timeout:
+        return ThreadPoolExecutor(max_workers=num_workers)
+    executor = ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=_MP_CONTEXT,
+        initializer=_pin_worker,
+        initargs=(_MP_CONTEXT.Value("i", 0),),
+    )
+    # Start the workers now so their startup cost is not timed against the first size.
+    executor.submit(int).result()
+    return executor
+
+
 def update_missing_iterations_concurrent(
     csv_path,
     size,
@@ -83,12 +395,14 @@ def update_missing_iterations_concurrent(
     threshold,
     num_workers,
     per_run_timeout=False,
+    executor=None,
+    recorded=None,
 ):
     """
     Schedule and execute missing iterations concurrently for each sorting algorithm.
 
     The function:
-      1. Reads the CSV to determine which iterations exist.
+      1. Determines which iterations already exist in the CSV.
       2. Identifies missing iteration numbers per algorithm.
       3. Schedules tasks for missing iterations.
       4. Writes each iteration result immediately to the CSV.
@@ -104,28 +418,36 @@ def update_missing_iterations_concurrent(
       threshold (float): Time threshold to determine if an algorithm should be skipped.
       num_workers (int): Number of worker processes to use.
       per_run_timeout (bool): Enable per-iteration timeout if True.
+      executor (Executor): Shared executor from create_executor(). If None, a temporary
+                           one is created and shut down before returning.
+      recorded (dict): Iteration numbers already in the CSV per algorithm, as returned
+                       by get_csv_results_for_size(). If None, the CSV is read to find them.
 
     Returns:
       tuple: (updated size_results, updated skip_list)
     """
-    # PART 1: Build mapping of existing iterations from CSV.
-    existing_iters = {alg: set() for alg in expected_algs}
-    try:
-        with open(csv_path, "r", newline="") as f:
-            reader = csv.reader(f)
-            next(reader, None)  # Skip header.
-            for row in reader:
-                if not row or len(row) < 4:
-                    continue
-                alg_name = row[0]
-                try:
-                    iter_num = int(row[2])
-                except Exception:
-                    continue
-                if alg_name in existing_iters:
-                    existing_iters[alg_name].add(iter_num)
-    except Exception as e:
-        debug(f"Error reading CSV {csv_path}: {e}")
+    # PART 1: Build mapping of existing iterations from CSV, unless the caller already
+    # has it from parsing the file.
+    if recorded is not None:
+        existing_iters = recorded
+    else:
+        existing_iters = {alg: set() for alg in expected_algs}
+        try:
+            with open(csv_path, "r", newline="") as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Skip header.
+                for row in reader:
+                    if not row or len(row) < 4:
+                        continue
+                    alg_name = row[0]
+                    try:
+                        iter_num = int(row[2])
+                    except Exception:
+                        continue
+                    if alg_name in existing_iters:
+                        existing_iters[alg_name].add(iter_num)
+        except Exception as e:
+            debug(f"Error reading CSV {csv_path}: {e}")
 
     # PART 2: Determine missing iterations for each algorithm.
     missing_algs = {}
@@ -168,89 +490,125 @@ def update_missing_iterations_concurrent(
         return size_results, skip_list
 
     # PART 4: Schedule tasks using a concurrent executor.
+    # Untimed iterations are grouped into batches so each task runs several iterations
+    # per round trip to a worker. Timed iterations stay one per task so that each one
+    # can be terminated on its own.
+    # Timed iterations pay a process spawn each, so they always use every worker.
+    # Untimed sizes are limited to the workers their per-iteration work can justify.
+    if per_run_timeout:
+        max_in_flight = num_workers
+        batch_size = 1
+    else:
+        max_in_flight = get_workers_for_size(size, num_workers)
+        batch_size = max(1, iterations // (max_in_flight * 4))
+    # Small arrays usually sort in microseconds, so dispatching them to worker
+    # processes would cost far more than the sorts themselves; run those in this
+    # process. Each algorithm's first iteration runs on its own, so algorithms that are
+    # slow even on small arrays are sent to the pool after a single iteration.
+    run_inline = not per_run_timeout and size <= IN_PROCESS_MAX_SIZE
+    first = 1 if run_inline else 0
+    batches = []
+    for alg, missing_list in missing_algs.items():
+        if run_inline:
+            batches.append((alg, missing_list[:1]))
+        batches.extend(
+            (alg, missing_list[start : start + batch_size])
+            for start in range(first, len(missing_list), batch_size)
+        )
     completed_counts = {}
-    tasks = {}
-    ExecutorClass = ThreadPoolExecutor if per_run_timeout else ProcessPoolExecutor
-
-    with ExecutorClass(max_workers=num_workers) as executor:
-        for alg, missing_list in missing_algs.items():
-            for iter_num in missing_list:
-                if shutdown_requested:
-                    print("Shutdown requested. Exiting immediately.")
-                    sys.exit(0)
-                if per_run_timeout:
-                    future = executor.submit(
-                        safe_run_iteration, get_algorithms()[alg], size, threshold
-                    )
-                else:
-                    future = executor.submit(run_iteration, get_algorithms()[alg], size)
-                tasks[future] = (alg, iter_num)
-        debug(f"Scheduled {len(tasks)} tasks for missing iterations.")
+    times_by_alg = {}
+    own_executor = executor is None
+    if own_executor:
+        executor = create_executor(num_workers, per_run_timeout)
+    csv_file = None
+    row_queue = None
+    writer_thread = None
+    completed = None
 
-        # PART 5: Process task results and write each result immediately to CSV.
-        for future in as_completed(tasks):
+    try:
+        if run_inline:
+            # Rows are written directly here so that no writer thread can take the GIL
+            # while an in-process iteration is being timed. The file stays open for the
+            # whole size rather than being reopened for every batch.
+            csv_file = open(csv_path, "a", newline="")
+            debug(f"Running {len(batches)} batches in-process for size {size}.")
+            completed = _run_batches_inline(batches, size, executor, num_workers)
+        else:
+            row_queue = Queue()
+            writer_thread = threading.Thread(
+                target=_csv_writer_loop, args=(csv_path, row_queue), daemon=True
+            )
+            writer_thread.start()
+            debug(
+                f"Scheduling {len(batches)} tasks for missing iterations "
+                f"({max_in_flight} at a time)."
+            )
+            completed = _run_batches_pooled(
+                executor, batches, size, threshold, per_run_timeout, max_in_flight
+            )
+
+        # PART 5: Process task results and write each batch immediately to CSV.
+        for alg, batch, times in completed:
             if shutdown_requested:
-                for f in tasks:
-                    f.cancel()
+                completed.close()
                 print("Shutdown requested during task processing. Exiting loop.")
                 sys.exit(0)
-            alg, iter_num = tasks[future]
-            completed_counts[alg] = completed_counts.get(alg, 0) + 1
-            try:
-                t = future.result()
-                debug(f"Task complete for {alg} iteration {iter_num}: result={t}")
-            except Exception as e:
-                print(f"{alg} error on size {size} iteration {iter_num}: {e}")
-                t = None
-
-            # Write the result to CSV immediately.
-            try:
-                with open(csv_path, "a", newline="") as csv_file:
-                    writer = csv.writer(csv_file)
-                    row = [alg, size, iter_num, "DNF" if t is None else f"{t:.8f}"]
-                    writer.writerow(row)
-                    csv_file.flush()
-                    os.fsync(csv_file.fileno())
-                debug(f"Wrote row to CSV: {row}")
-            except Exception as e:
-                print(f"Error writing {alg} iteration {iter_num} to CSV: {e}")
-
-            # Update in-memory results.
-            if size_results.get(alg) is None:
-                size_results[alg] = (None, None, None, None, 0, [])
-            old_times = size_results[alg][5]
-            if isinstance(old_times, list):
-                old_times = {i + 1: old_times[i] for i in range(len(old_times))}
-            old_times[iter_num] = t
-            new_count = len(old_times)
-            size_results[alg] = (None, None, None, None, new_count, old_times)
+            completed_counts[alg] = completed_counts.get(alg, 0) + len(batch)
+
+            # Write the batch to CSV immediately. Handing the rows to the OS is enough to
+            # survive the benchmark process dying; there is no per-batch fsync.
+            text = _format_csv_rows(alg, size, batch, times)
+            if row_queue is not None:
+                row_queue.put(text)
+            else:
+                _append_csv_rows(csv_file, text)
+
+            # Collect new times in a list preallocated to the algorithm's missing
+            # iterations; size_results is only updated once the algorithm is complete.
+            # Every batch is a contiguous run of the sorted missing list, so its slot
+            # is found by bisection.
+            missing = missing_algs[alg]
+            alg_times = times_by_alg.get(alg)
+            if alg_times is None:
+                alg_times = times_by_alg[alg] = [None] * len(missing)
+            start = bisect_left(missing, batch[0])
+            alg_times[start : start + len(batch)] = times
 
             # Compute final statistics once all missing iterations for an algorithm are complete.
-            if completed_counts[alg] == len(missing_algs.get(alg, [])):
-                times_dict = size_results[alg][5]
-                times_list = [times_dict[k] for k in sorted(times_dict.keys())]
-                successful_times = [x for x in times_list if x is not None]
-                dnf_count = len(times_list) - len(successful_times)
-                if successful_times:
-                    avg = compute_average(successful_times)
-                    median = compute_median(successful_times)
-                    min_time = min(successful_times)
-                    max_time = max(successful_times)
-                else:
-                    avg = float("inf")
-                    median = None
-                    min_time = None
-                    max_time = None
-                size_results[alg] = (
-                    avg,
-                    min_time,
-                    max_time,
-                    median,
-                    len(times_list),
-                    times_list,
-                )
+            if completed_counts[alg] == len(missing):
+                # Keep the new times exactly as a later run would read them back from
+                # the CSV: rounded as _format_csv_rows() writes them, with iterations
+                # that did not finish left out. A resumed run then reports the same
+                # statistics as one that ran straight through.
+                new_times = [float(f"{t:.7f}") for t in alg_times if t is not None]
+                dnf_count = len(alg_times) - len(new_times)
+                # Times already read from the CSV come first; the missing iterations
+                # never overlap them.
+                data = size_results.get(alg)
+                times_list = list(data[5]) if data else []
+                times_list.extend(new_times)
+                if not times_list:
+                    # No run finished: like read_csv_results(), report nothing for
+                    # this size.
+                    size_results[alg] = None
+                    print(f"{alg} on size {format_size(size)}: DNF ({dnf_count})")
+                    continue
+                stats = compute_stats(times_list)
+                size_results[alg] = (*stats, len(times_list), times_list)
                 print(
-                    f"{alg} on size {format_size(size)}: {format_time(avg, False)} "
+                    f"{alg} on size {format_size(size)}: {format_time(stats[0], False)} "
                     + (f"(DNF: {dnf_count})" if dnf_count > 0 else "")
                 )
+    finally:
+        if completed is not None:
+            # Cancel any tasks that have not started if we are leaving early.
+            completed.close()
+        if csv_file is not None:
+            csv_file.close()
+        if writer_thread is not None:
+            # Let the writer drain any queued rows and close the file.
+            row_queue.put(None)
+            writer_thread.join()
+        if own_executor:
+            executor.shutdown()
     return size_results, skip_list
@@ -7,11 +7,15 @@ determining the number of worker processes to use for the benchmark.
 Functions:
   - generate_sizes(): Produces a sorted list of unique array sizes.
   - get_num_workers(): Determines the worker count based on CPU cores, current time, and SLOW_MODE setting.
+  - get_workers_for_size(): Limits the worker count to what an array size can make use of.
 """
 
 import math
 import os
 import datetime
+from functools import lru_cache
+from . import config
+from .config import IN_PROCESS_MAX_SIZE
 
 
 def generic_round(x, base=25, tol=3):
@@ -46,14 +50,33 @@ def generate_sizes():
 
     For sizes larger than the maximum small size, the function generates "nice" large sizes.
     These are computed using a set of factors [2.5, 5, 7.5, 10] applied to increasing
-    powers of 10, ensuring that the large sizes are round numbers (e.g., 500, 750, 1000, 2500, etc.).
+    powers of 10, ensuring that the large sizes are round numbers (e.g., 500, 750, 1000, 2500, etc.),
+    up to config.MAX_SIZE.
 
     The final list of sizes is the union of the adjusted small sizes and the generated large sizes,
     sorted in ascending order.
 
+    config.MAX_SIZE is read on every call, so it can be changed at runtime. The sizes
+    are deterministic for a given MAX_SIZE, so they are cached, keyed on that value;
+    each call returns a fresh list.
+
     Returns:
       list: A sorted list of unique array sizes.
     """
+    return list(_compute_sizes(config.MAX_SIZE))
+
+
+@lru_cache(maxsize=1)
+def _compute_sizes(max_size):
+    """
+    Compute the benchmark sizes described in generate_sizes().
+
+    Parameters:
+      max_size (int): The largest size to generate.
+
+    Returns:
+      tuple: The sorted unique array sizes.
+    """
     n_small = 15
 
     # Generate small sizes using a geometric progression.
@@ -81,17 +104,33 @@ def generate_sizes():
             size_val = f * base
             # Only include the value if it exceeds the maximum of the small sizes.
             if size_val > max_small:
-                # Stop adding if the size exceeds the upper bound of 1e12.
-                if size_val > 1e12:
+                # Stop adding if the size exceeds the upper bound of max_size.
+                if size_val > max_size:
                     break
                 large_sizes.append(int(size_val))
-        # Exit the loop if the largest value in the current group exceeds 1e12.
-        if factors[-1] * base > 1e12:
+        # Exit the loop if the largest value in the current group exceeds max_size.
+        if factors[-1] * base > max_size:
             break
         e += 1
 
     # Return the sorted union of small and large sizes.
-    return sorted(set(small_sizes + large_sizes))
+    return tuple(sorted(set(small_sizes + large_sizes)))
+
+
+def _available_cpus():
+    """
+    Return the number of CPU cores this process is allowed to run on.
+
+    Uses the process CPU affinity where available (Linux), which respects taskset and
+    cpuset limits that os.cpu_count() ignores. Falls back to os.cpu_count() elsewhere.
+
+    Returns:
+      int: The number of usable CPU cores (minimum of 1).
+    """
+    try:
+        return max(len(os.sched_getaffinity(0)), 1)
+    except AttributeError:
+        return os.cpu_count() or 1
 
 
 def get_num_workers():
@@ -108,11 +147,15 @@ def get_num_workers():
       3. Further adjust based on SLOW_MODE or FAST_MODE:
          - If SLOW_MODE is enabled, halve the worker count.
          - Else if FAST_MODE is enabled, use all cores minus 2.
+      4. Cap the result at config.MAX_WORKERS, if set.
+
+    The total core count is the number of cores this process may run on, not the number
+    installed on the machine.
 
     Returns:
       int: The number of worker processes (minimum of 1).
     """
-    total = os.cpu_count() or 1
+    total = _available_cpus()
 
     # If running in GitHub Actions and USE_ALL_CPUS is set, return all cores.
     if (
@@ -133,4 +176,31 @@ def get_num_workers():
     elif os.environ.get("FAST_MODE", "").lower() == "true":
         workers = max(total - 2, 1)
 
+    if config.MAX_WORKERS is not None:
+        workers = max(min(workers, config.MAX_WORKERS), 1)
+
     return workers
+
+
+def get_workers_for_size(size, num_workers):
+    """
+    Limit the number of concurrent workers used for a given array size.
+
+    Parallelism only pays off once a single iteration does enough work to outweigh the
+    cost of dispatching it and the contention between workers:
+      - Sizes up to IN_PROCESS_MAX_SIZE run in the main process, so use 1 worker.
+      - Sizes below 100,000 use at most 4 workers.
+      - Larger sizes use every available worker.
+
+    Parameters:
+      size (int): The array size being benchmarked.
+      num_workers (int): The number of workers available.
+
+    Returns:
+      int: The number of workers to use for this size (minimum of 1).
+    """
+    if size <= IN_PROCESS_MAX_SIZE:
+        return 1
+    if size < 100000:
+        return max(min(4, num_workers), 1)
+    return max(num_workers, 1)